@@ -1,5 +1,5 @@
-from django.urls import path, include
-from .views import *
+from django.urls import path
+from .views import docs, home, my_contacts, profile, register, updates
 
 urlpatterns = [
     path('', home, name='home'),